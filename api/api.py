@@ -1,14 +1,25 @@
 import os
+import re
 import logging
 from fastapi import FastAPI, HTTPException, Query, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
-from typing import List, Optional, Dict, Any, Literal
-import json
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+from typing import List, Optional, Dict, Any, Iterator, Literal
+import cbor2
+import orjson
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 import google.generativeai as genai
 import asyncio
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 
 # Configure logging
 from api.logging_config import setup_logging
@@ -17,12 +28,57 @@ setup_logging()
 logger = logging.getLogger(__name__)
 
 
+def _orjson_default(obj: Any) -> Any:
+    """Serializes Pydantic models that orjson does not know natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class ORJSONModelResponse(ORJSONResponse):
+    """
+    ORJSONResponse that also accepts Pydantic models, anywhere in the content.
+
+    Returning one of these from an endpoint hands the models straight to orjson,
+    skipping FastAPI's recursive jsonable_encoder pass.
+    """
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware that passes the given paths through uncompressed.
+
+    Older Starlette releases buffer and compress text/event-stream responses too,
+    which holds back server-sent events until the stream ends.
+    """
+
+    def __init__(self, app, excluded_paths: tuple = (), **kwargs) -> None:
+        super().__init__(app, **kwargs)
+        self.excluded_paths = frozenset(excluded_paths)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Streaming API",
-    description="API for streaming chat completions"
+    description="API for streaming chat completions",
+    default_response_class=ORJSONModelResponse
 )
 
+# Middleware must be pure ASGI (a class taking `app` and implementing
+# `async def __call__(self, scope, receive, send)`), like CORSMiddleware and
+# StreamingAwareGZipMiddleware below. Do not add BaseHTTPMiddleware or
+# @app.middleware("http"): it allocates an extra Request/Response and task per
+# request and buffers streaming responses such as /chat/completions/stream.
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -32,7 +88,18 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
-# Helper function to get adalflow root path
+# Compress larger responses (wiki caches, exports, project lists are very repetitive JSON/Markdown).
+# The streaming chat endpoint is excluded explicitly so its events are never buffered,
+# whichever Starlette version is installed.
+app.add_middleware(
+    StreamingAwareGZipMiddleware,
+    excluded_paths=("/chat/completions/stream",),
+    minimum_size=1024,
+    compresslevel=5,
+)
+
+# Helper function to get adalflow root path (expanduser is only resolved once)
+@lru_cache(maxsize=1)
 def get_adalflow_default_root_path():
     return os.path.expanduser(os.path.join("~", ".adalflow"))
 
@@ -115,7 +182,7 @@ class WikiExportRequest(BaseModel):
     """
     repo_url: str = Field(..., description="URL of the repository")
     pages: List[WikiPage] = Field(..., description="List of wiki pages to export")
-    format: Literal["markdown", "json"] = Field(..., description="Export format (markdown or json)")
+    format: Literal["markdown", "json", "cbor"] = Field(..., description="Export format (markdown, json or cbor)")
 
 # --- Model Configuration Models ---
 class Model(BaseModel):
@@ -148,14 +215,15 @@ from api.config import configs, WIKI_AUTH_MODE, WIKI_AUTH_CODE
 
 @app.get("/lang/config")
 async def get_lang_config():
-    return configs["lang_config"]
+    # Static config, hand it straight to orjson without the jsonable_encoder pass
+    return ORJSONResponse(configs["lang_config"])
 
 @app.get("/auth/status")
 async def get_auth_status():
     """
     Check if authentication is required for the wiki.
     """
-    return {"auth_required": WIKI_AUTH_MODE}
+    return ORJSONResponse({"auth_required": WIKI_AUTH_MODE})
 
 @app.post("/auth/validate")
 async def validate_auth_code(request: AuthorizationConfig):
@@ -164,8 +232,52 @@ async def validate_auth_code(request: AuthorizationConfig):
     """
     return {"success": WIKI_AUTH_CODE == request.code}
 
-@app.get("/models/config", response_model=ModelConfig)
-async def get_model_config():
+@lru_cache(maxsize=1)
+def build_model_config_payload() -> bytes:
+    """
+    Builds the serialized model configuration once.
+
+    The provider configuration is loaded at import time and never changes while
+    the server is running, so the JSON bytes are computed on first use and reused.
+    """
+    # Plain dicts shaped like ModelConfig; the config is trusted, so no Pydantic models are needed
+    providers = []
+    default_provider = configs.get("default_provider", "google")
+
+    # Add provider configuration based on config.py
+    for provider_id, provider_config in configs["providers"].items():
+        providers.append({
+            "id": provider_id,
+            "name": provider_id.capitalize(),
+            # Add models from config
+            "models": [{"id": model_id, "name": model_id} for model_id in provider_config["models"]],
+            "supportsCustomModel": provider_config.get("supportsCustomModel", False)
+        })
+
+    return orjson.dumps({"providers": providers, "defaultProvider": default_provider})
+
+@lru_cache(maxsize=1)
+def get_model_config_etag() -> str:
+    """Strong ETag for the (immutable) serialized model configuration."""
+    return f'"{hashlib.blake2b(build_model_config_payload(), digest_size=8).hexdigest()}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Checks the request's If-None-Match header against an ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, and accepts
+    lists of ETags as well as "*".
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in header.split(","))
+
+@app.get("/models/config", response_model=None, responses={200: {"model": ModelConfig}})
+async def get_model_config(request: Request):
     """
     Get available model providers and their models.
 
@@ -177,40 +289,17 @@ async def get_model_config():
     """
     try:
         logger.info("Fetching model configurations")
-
-        # Create providers from the config file
-        providers = []
-        default_provider = configs.get("default_provider", "google")
-
-        # Add provider configuration based on config.py
-        for provider_id, provider_config in configs["providers"].items():
-            models = []
-            # Add models from config
-            for model_id in provider_config["models"].keys():
-                # Get a more user-friendly display name if possible
-                models.append(Model(id=model_id, name=model_id))
-
-            # Add provider with its models
-            providers.append(
-                Provider(
-                    id=provider_id,
-                    name=f"{provider_id.capitalize()}",
-                    supportsCustomModel=provider_config.get("supportsCustomModel", False),
-                    models=models
-                )
-            )
-
-        # Create and return the full configuration
-        config = ModelConfig(
-            providers=providers,
-            defaultProvider=default_provider
-        )
-        return config
+        content = build_model_config_payload()
+        etag = get_model_config_etag()
+        # The configuration never changes at runtime, so clients can revalidate for free
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=content, media_type="application/json", headers={"ETag": etag})
 
     except Exception as e:
-        logger.error(f"Error creating model configuration: {str(e)}")
+        logger.error("Error creating model configuration: %s", e)
         # Return some default configuration in case of error
-        return ModelConfig(
+        config = ModelConfig(
             providers=[
                 Provider(
                     id="google",
@@ -223,11 +312,12 @@ async def get_model_config():
             ],
             defaultProvider="google"
         )
+        return ORJSONModelResponse(config)
 
 @app.post("/export/wiki")
 async def export_wiki(request: WikiExportRequest):
     """
-    Export wiki content as Markdown or JSON.
+    Export wiki content as Markdown, JSON or CBOR.
 
     Args:
         request: The export request containing wiki pages and format
@@ -236,42 +326,108 @@ async def export_wiki(request: WikiExportRequest):
         A downloadable file in the requested format
     """
     try:
-        logger.info(f"Exporting wiki for {request.repo_url} in {request.format} format")
+        logger.info("Exporting wiki for %s in %s format", request.repo_url, request.format)
 
         # Extract repository name from URL for the filename
         repo_parts = request.repo_url.rstrip('/').split('/')
         repo_name = repo_parts[-1] if len(repo_parts) > 0 else "wiki"
 
         # Get current timestamp for the filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+
+        if request.format == "cbor":
+            # Generate CBOR content, a compact binary alternative to the JSON export
+            content = await asyncio.to_thread(generate_cbor_export, request.repo_url, request.pages)
+            return Response(
+                content=content,
+                media_type="application/cbor",
+                headers={
+                    "Content-Disposition": f"attachment; filename={repo_name}_wiki_{timestamp}.cbor"
+                }
+            )
 
         if request.format == "markdown":
-            # Generate Markdown content
-            content = generate_markdown_export(request.repo_url, request.pages)
+            chunks = iter_markdown_export(request.repo_url, request.pages)
             filename = f"{repo_name}_wiki_{timestamp}.md"
             media_type = "text/markdown"
         else:  # JSON format
-            # Generate JSON content
-            content = generate_json_export(request.repo_url, request.pages)
+            chunks = iter_json_export(request.repo_url, request.pages)
             filename = f"{repo_name}_wiki_{timestamp}.json"
             media_type = "application/json"
 
-        # Create response with appropriate headers for file download
-        response = Response(
-            content=content,
+        # Build the first chunk here so that setup errors still surface as a 500;
+        # once the response has started, a failure can only cut the stream short.
+        first_chunk = next(chunks)
+
+        # Stream the file page by page so large wikis are never held in memory as a
+        # whole. Starlette iterates sync generators in its threadpool, which keeps the
+        # formatting work off the event loop.
+        return StreamingResponse(
+            chain((first_chunk,), chunks),
             media_type=media_type,
             headers={
                 "Content-Disposition": f"attachment; filename={filename}"
             }
         )
 
-        return response
-
     except Exception as e:
         error_msg = f"Error exporting wiki: {str(e)}"
         logger.error(error_msg)
         raise HTTPException(status_code=500, detail=error_msg)
 
+# Directory and file names skipped when listing a local repository
+LOCAL_REPO_EXCLUDED_DIRS = frozenset({'__pycache__', 'node_modules', '.venv'})
+LOCAL_REPO_EXCLUDED_FILES = frozenset({'__init__.py', '.DS_Store'})
+
+def scan_local_repo(path: str) -> tuple[List[str], str]:
+    """
+    Walks a local repository with os.scandir.
+
+    Hidden entries, virtual envs and other excluded names are skipped. Symlinked
+    directories are not followed, matching os.walk's default behaviour.
+
+    Returns:
+        The relative paths of all files, and the content of the first README.md found
+        (files of a directory are visited before its subdirectories)
+    """
+    file_tree_lines: List[str] = []
+    readme_path: Optional[str] = None
+
+    # Iterative pre-order walk, deep trees cannot hit the recursion limit
+    stack = [(path, "")]
+    while stack:
+        directory, rel_dir = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name[0] == '.':
+                        continue
+                    if entry.is_dir():
+                        if name not in LOCAL_REPO_EXCLUDED_DIRS and not entry.is_symlink():
+                            subdirs.append((entry.path, f"{rel_dir}{name}{os.sep}"))
+                    elif name not in LOCAL_REPO_EXCLUDED_FILES:
+                        file_tree_lines.append(rel_dir + name)
+                        # Find README.md (case-insensitive)
+                        if readme_path is None and name.lower() == 'readme.md':
+                            readme_path = entry.path
+        except OSError as e:
+            logger.warning("Could not scan directory %s: %s", directory, e)
+            continue
+        # Reversed so subdirectories are popped in listing order
+        stack.extend(reversed(subdirs))
+
+    readme_content = ""
+    if readme_path:
+        try:
+            with open(readme_path, 'r', encoding='utf-8') as f:
+                readme_content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning("Could not read README.md: %s", e)
+
+    return file_tree_lines, readme_content
+
 @app.get("/local_repo/structure")
 async def get_local_repo_structure(path: str = Query(None, description="Path to local repository")):
     """Return the file tree and README content for a local repository."""
@@ -288,85 +444,121 @@ async def get_local_repo_structure(path: str = Query(None, description="Path to
         )
 
     try:
-        logger.info(f"Processing local repository at: {path}")
-        file_tree_lines = []
-        readme_content = ""
-
-        for root, dirs, files in os.walk(path):
-            # Exclude hidden dirs/files and virtual envs
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__' and d != 'node_modules' and d != '.venv']
-            for file in files:
-                if file.startswith('.') or file == '__init__.py' or file == '.DS_Store':
-                    continue
-                rel_dir = os.path.relpath(root, path)
-                rel_file = os.path.join(rel_dir, file) if rel_dir != '.' else file
-                file_tree_lines.append(rel_file)
-                # Find README.md (case-insensitive)
-                if file.lower() == 'readme.md' and not readme_content:
-                    try:
-                        with open(os.path.join(root, file), 'r', encoding='utf-8') as f:
-                            readme_content = f.read()
-                    except Exception as e:
-                        logger.warning(f"Could not read README.md: {str(e)}")
-                        readme_content = ""
+        logger.info("Processing local repository at: %s", path)
+        # Walk the repository off the event loop, it can take a while on large repos
+        file_tree_lines, readme_content = await asyncio.to_thread(scan_local_repo, path)
 
         file_tree_str = '\n'.join(sorted(file_tree_lines))
         return {"file_tree": file_tree_str, "readme": readme_content}
     except Exception as e:
-        logger.error(f"Error processing local repository: {str(e)}")
+        logger.error("Error processing local repository: %s", e)
         return JSONResponse(
             status_code=500,
             content={"error": f"Error processing local repository: {str(e)}"}
         )
 
-def generate_markdown_export(repo_url: str, pages: List[WikiPage]) -> str:
+def iter_markdown_export(repo_url: str, pages: List[WikiPage]) -> Iterator[str]:
     """
-    Generate Markdown export of wiki pages.
+    Generate Markdown export of wiki pages, one chunk per page.
 
     Args:
         repo_url: The repository URL
         pages: List of wiki pages
 
-    Returns:
-        Markdown content as string
+    Yields:
+        The header and table of contents, then the Markdown of each page
     """
-    # Start with metadata
-    markdown = f"# Wiki Documentation for {repo_url}\n\n"
-    markdown += f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    # Start with metadata and the table of contents
+    parts: List[str] = [
+        f"# Wiki Documentation for {repo_url}\n\n",
+        f"Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        "## Table of Contents\n\n",
+    ]
+    parts.extend(f"- [{page.title}](#{page.id})\n" for page in pages)
+    parts.append("\n")
+    yield "".join(parts)
 
-    # Add table of contents
-    markdown += "## Table of Contents\n\n"
-    for page in pages:
-        markdown += f"- [{page.title}](#{page.id})\n"
-    markdown += "\n"
+    # Index titles by page id for related page lookups (first page wins on duplicate ids)
+    titles_by_id = {page.id: page.title for page in reversed(pages)}
 
     # Add each page
     for page in pages:
-        markdown += f"<a id='{page.id}'></a>\n\n"
-        markdown += f"## {page.title}\n\n"
-
-
+        parts = [f"<a id='{page.id}'></a>\n\n", f"## {page.title}\n\n"]
 
         # Add related pages
-        if page.relatedPages and len(page.relatedPages) > 0:
-            markdown += "### Related Pages\n\n"
-            related_titles = []
-            for related_id in page.relatedPages:
-                # Find the title of the related page
-                related_page = next((p for p in pages if p.id == related_id), None)
-                if related_page:
-                    related_titles.append(f"[{related_page.title}](#{related_id})")
+        if page.relatedPages:
+            parts.append("### Related Pages\n\n")
+            related_titles = [
+                f"[{titles_by_id[related_id]}](#{related_id})"
+                for related_id in page.relatedPages
+                if related_id in titles_by_id
+            ]
 
             if related_titles:
-                markdown += "Related topics: " + ", ".join(related_titles) + "\n\n"
+                parts.append(f"Related topics: {', '.join(related_titles)}\n\n")
 
         # Add page content
-        markdown += f"{page.content}\n\n"
-        markdown += "---\n\n"
+        parts.append(f"{page.content}\n\n")
+        parts.append("---\n\n")
+        yield "".join(parts)
+
+def generate_markdown_export(repo_url: str, pages: List[WikiPage]) -> str:
+    """
+    Generate Markdown export of wiki pages.
+
+    Args:
+        repo_url: The repository URL
+        pages: List of wiki pages
+
+    Returns:
+        Markdown content as string
+    """
+    return "".join(iter_markdown_export(repo_url, pages))
+
+def build_export_metadata(repo_url: str, pages: List[WikiPage]) -> Dict[str, Any]:
+    """
+    Build the metadata block shared by the structured (JSON and CBOR) exports.
+    """
+    return {
+        "repository": repo_url,
+        # UTC with an explicit offset, formatted without building a datetime object
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "page_count": len(pages)
+    }
+
+# Built once so the page serializers are not rebuilt per export
+WIKI_PAGE_ADAPTER = TypeAdapter(WikiPage)
+WIKI_PAGES_ADAPTER = TypeAdapter(List[WikiPage])
+
+def iter_json_export(repo_url: str, pages: List[WikiPage]) -> Iterator[bytes]:
+    """
+    Generate JSON export of wiki pages, one chunk per page.
+
+    Args:
+        repo_url: The repository URL
+        pages: List of wiki pages
+
+    Yields:
+        UTF-8 encoded fragments of the pretty-printed JSON document
+    """
+    metadata = build_export_metadata(repo_url, pages)
 
-    return markdown
+    # Pretty-print each block on its own and splice it into the envelope. Newlines
+    # inside JSON strings are always escaped, so every raw newline is formatting and
+    # can be shifted to nest the block at the right depth.
+    metadata_json = orjson.dumps(metadata, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  ")
+    if not pages:
+        yield b'{\n  "metadata": ' + metadata_json + b',\n  "pages": []\n}'
+        return
 
-def generate_json_export(repo_url: str, pages: List[WikiPage]) -> str:
+    yield b'{\n  "metadata": ' + metadata_json + b',\n  "pages": ['
+    separator = b"\n    "
+    for page in pages:
+        yield separator + WIKI_PAGE_ADAPTER.dump_json(page, indent=2).replace(b"\n", b"\n    ")
+        separator = b",\n    "
+    yield b'\n  ]\n}'
+
+def generate_json_export(repo_url: str, pages: List[WikiPage]) -> bytes:
     """
     Generate JSON export of wiki pages.
 
@@ -375,20 +567,28 @@ def generate_json_export(repo_url: str, pages: List[WikiPage]) -> str:
         pages: List of wiki pages
 
     Returns:
-        JSON content as string
-    """
-    # Create a dictionary with metadata and pages
-    export_data = {
-        "metadata": {
-            "repository": repo_url,
-            "generated_at": datetime.now().isoformat(),
-            "page_count": len(pages)
-        },
-        "pages": [page.model_dump() for page in pages]
-    }
+        UTF-8 encoded JSON content, ready to be sent as a response body
+    """
+    return b"".join(iter_json_export(repo_url, pages))
+
+def generate_cbor_export(repo_url: str, pages: List[WikiPage]) -> bytes:
+    """
+    Generate CBOR export of wiki pages.
+
+    Carries the same document as the JSON export in a binary encoding, which is
+    noticeably smaller for wikis with a lot of page content.
 
-    # Convert to JSON string with pretty formatting
-    return json.dumps(export_data, indent=2)
+    Args:
+        repo_url: The repository URL
+        pages: List of wiki pages
+
+    Returns:
+        CBOR encoded content
+    """
+    return cbor2.dumps({
+        "metadata": build_export_metadata(repo_url, pages),
+        "pages": WIKI_PAGES_ADAPTER.dump_python(pages)
+    })
 
 # Import the simplified chat implementation
 from api.simple_chat import chat_completions_stream
@@ -405,28 +605,131 @@ app.add_websocket_route("/ws/chat", handle_websocket_chat)
 WIKI_CACHE_DIR = os.path.join(get_adalflow_default_root_path(), "wikicache")
 os.makedirs(WIKI_CACHE_DIR, exist_ok=True)
 
+# Wiki cache file operations run on their own pool so quick stats and reads never
+# queue behind long jobs (repo walks, exports) on the default executor
+WIKI_CACHE_IO_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="wiki-cache-io")
+
+async def run_wiki_cache_io(func, *args):
+    """Runs a blocking wiki cache file operation on WIKI_CACHE_IO_EXECUTOR."""
+    return await asyncio.get_running_loop().run_in_executor(WIKI_CACHE_IO_EXECUTOR, func, *args)
+
+# Serialized responses of recently read wiki caches, most recently used last.
+# Maps (owner, repo, repo_type, language) to (ETag of the cache file, JSON bytes).
+# Bounded by total size rather than entry count, since a single cache file can be
+# several MB; the budget applies per worker process.
+WIKI_CACHE_MEMORY_MAX_BYTES = 64 * 1024 * 1024
+wiki_cache_memory: "OrderedDict[tuple, tuple[str, bytes]]" = OrderedDict()
+wiki_cache_memory_bytes = 0
+
+def remember_wiki_cache(key: tuple, entry: tuple[str, bytes]) -> None:
+    """Stores a wiki cache in memory, evicting least recently used ones to stay within budget."""
+    global wiki_cache_memory_bytes
+    previous = wiki_cache_memory.pop(key, None)
+    if previous is not None:
+        wiki_cache_memory_bytes -= len(previous[1])
+    if len(entry[1]) > WIKI_CACHE_MEMORY_MAX_BYTES:
+        # Larger than the whole budget, serve it from disk every time
+        return
+    wiki_cache_memory[key] = entry
+    wiki_cache_memory_bytes += len(entry[1])
+    while wiki_cache_memory_bytes > WIKI_CACHE_MEMORY_MAX_BYTES:
+        _, (_, evicted) = wiki_cache_memory.popitem(last=False)
+        wiki_cache_memory_bytes -= len(evicted)
+
+def invalidate_wiki_cache_memory(owner: str, repo: str, repo_type: str, language: str) -> None:
+    """Drops the in-memory copy of a wiki cache after it is rewritten or deleted."""
+    global wiki_cache_memory_bytes
+    entry = wiki_cache_memory.pop((owner, repo, repo_type, language), None)
+    if entry is not None:
+        wiki_cache_memory_bytes -= len(entry[1])
+
+# Last processed projects listing (sorted, most recent first), keyed by the
+# WIKI_CACHE_DIR st_mtime_ns it was scanned at. Cache files are only ever
+# created by an atomic rename or removed, both of which bump the directory mtime,
+# so the listing stays valid across worker processes until the mtime moves.
+# The full listing is also kept pre-encoded, since most clients ask for all of it.
+processed_projects_cache: Optional[tuple[int, List[Dict[str, Any]], bytes]] = None
+
+def invalidate_processed_projects_cache() -> None:
+    """Forces the next processed projects request to rescan WIKI_CACHE_DIR."""
+    global processed_projects_cache
+    processed_projects_cache = None
+
+# Bounded, since owner/repo come straight from client requests
+@lru_cache(maxsize=1024)
 def get_wiki_cache_path(owner: str, repo: str, repo_type: str, language: str) -> str:
     """Generates the file path for a given wiki cache."""
-    filename = f"deepwiki_cache_{repo_type}_{owner}_{repo}_{language}.json"
-    return os.path.join(WIKI_CACHE_DIR, filename)
+    # WIKI_CACHE_DIR is resolved once at import, so a single f-string is enough here
+    return f"{WIKI_CACHE_DIR}{os.sep}deepwiki_cache_{repo_type}_{owner}_{repo}_{language}.json"
 
-async def read_wiki_cache(owner: str, repo: str, repo_type: str, language: str) -> Optional[WikiCacheData]:
-    """Reads wiki cache data from the file system."""
-    cache_path = get_wiki_cache_path(owner, repo, repo_type, language)
-    if os.path.exists(cache_path):
+def write_file_atomic(path: str, content: bytes) -> None:
+    """
+    Writes content to path so readers never observe a partially written file.
+
+    The bytes go to a unique temp file in the same directory, which is fsynced and
+    then moved over the target with os.replace (atomic on the same filesystem).
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}.{uuid.uuid4().hex}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave stray temp files behind on failure
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return WikiCacheData(**data)
-        except Exception as e:
-            logger.error(f"Error reading wiki cache from {cache_path}: {e}")
-            return None
-    return None
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+async def read_wiki_cache_bytes(owner: str, repo: str, repo_type: str, language: str) -> Optional[tuple[str, bytes]]:
+    """
+    Returns the ETag and raw JSON bytes of a wiki cache file, serving repeat reads from memory.
+
+    Cache files are written by save_wiki_cache from an already validated request,
+    so their bytes are returned as-is without parsing or re-serializing them.
+    The ETag is derived from the file's mtime and size, and the in-memory copy is
+    reused only while it is unchanged, so the file on disk stays the source of truth.
+    """
+    key = (owner, repo, repo_type, language)
+    cache_path = get_wiki_cache_path(owner, repo, repo_type, language)
+    try:
+        stat_result = await run_wiki_cache_io(os.stat, cache_path)
+    except FileNotFoundError:
+        # A cache miss is the common case, not an error
+        invalidate_wiki_cache_memory(owner, repo, repo_type, language)
+        return None
+    except OSError as e:
+        logger.error("Error reading wiki cache from %s: %s", cache_path, e)
+        invalidate_wiki_cache_memory(owner, repo, repo_type, language)
+        return None
+    etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+    entry = wiki_cache_memory.get(key)
+    if entry is not None and entry[0] == etag:
+        wiki_cache_memory.move_to_end(key)
+        return entry
+
+    try:
+        content = await run_wiki_cache_io(Path(cache_path).read_bytes)
+    except FileNotFoundError:
+        # Deleted since the stat above; treat it like any other miss
+        invalidate_wiki_cache_memory(owner, repo, repo_type, language)
+        return None
+    except OSError as e:
+        logger.error("Error reading wiki cache from %s: %s", cache_path, e)
+        return None
+
+    entry = (etag, content)
+    remember_wiki_cache(key, entry)
+    return entry
 
 async def save_wiki_cache(data: WikiCacheRequest) -> bool:
     """Saves wiki cache data to the file system."""
     cache_path = get_wiki_cache_path(data.repo.owner, data.repo.repo, data.repo.type, data.language)
-    logger.info(f"Attempting to save wiki cache. Path: {cache_path}")
+    logger.info("Attempting to save wiki cache. Path: %s", cache_path)
     try:
         payload = WikiCacheData(
             wiki_structure=data.wiki_structure,
@@ -435,31 +738,31 @@ async def save_wiki_cache(data: WikiCacheRequest) -> bool:
             provider=data.provider,
             model=data.model
         )
+        # Serialize once; the same bytes are used for size logging and for the write
+        payload_bytes = orjson.dumps(payload.model_dump(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
         # Log size of data to be cached for debugging (avoid logging full content if large)
-        try:
-            payload_json = payload.model_dump_json()
-            payload_size = len(payload_json.encode('utf-8'))
-            logger.info(f"Payload prepared for caching. Size: {payload_size} bytes.")
-        except Exception as ser_e:
-            logger.warning(f"Could not serialize payload for size logging: {ser_e}")
-
-
-        logger.info(f"Writing cache file to: {cache_path}")
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(payload.model_dump(), f, indent=2)
-        logger.info(f"Wiki cache successfully saved to {cache_path}")
+        logger.info("Payload prepared for caching. Size: %s bytes.", len(payload_bytes))
+
+        logger.info("Writing cache file to: %s", cache_path)
+        # Write atomically and off the event loop so other requests proceed during large writes
+        await run_wiki_cache_io(write_file_atomic, cache_path, payload_bytes)
+        invalidate_wiki_cache_memory(data.repo.owner, data.repo.repo, data.repo.type, data.language)
+        invalidate_processed_projects_cache()
+        logger.info("Wiki cache successfully saved to %s", cache_path)
         return True
-    except IOError as e:
-        logger.error(f"IOError saving wiki cache to {cache_path}: {e.strerror} (errno: {e.errno})", exc_info=True)
+    except OSError as e:
+        # strerror/errno say all there is to say, no traceback needed
+        logger.error("IOError saving wiki cache to %s: %s (errno: %s)", cache_path, e.strerror, e.errno)
         return False
     except Exception as e:
-        logger.error(f"Unexpected error saving wiki cache to {cache_path}: {e}", exc_info=True)
+        logger.error("Unexpected error saving wiki cache to %s: %s", cache_path, e, exc_info=True)
         return False
 
 # --- Wiki Cache API Endpoints ---
 
-@app.get("/api/wiki_cache", response_model=Optional[WikiCacheData])
+@app.get("/api/wiki_cache", response_model=None, responses={200: {"model": Optional[WikiCacheData]}})
 async def get_cached_wiki(
+    request: Request,
     owner: str = Query(..., description="Repository owner"),
     repo: str = Query(..., description="Repository name"),
     repo_type: str = Query(..., description="Repository type (e.g., github, gitlab)"),
@@ -473,15 +776,20 @@ async def get_cached_wiki(
     if not supported_langs.__contains__(language):
         language = configs["lang_config"]["default"]
 
-    logger.info(f"Attempting to retrieve wiki cache for {owner}/{repo} ({repo_type}), lang: {language}")
-    cached_data = await read_wiki_cache(owner, repo, repo_type, language)
-    if cached_data:
-        return cached_data
+    logger.info("Attempting to retrieve wiki cache for %s/%s (%s), lang: %s", owner, repo, repo_type, language)
+    cached = await read_wiki_cache_bytes(owner, repo, repo_type, language)
+    if cached:
+        etag, cached_content = cached
+        # Let clients revalidate on every load instead of re-downloading an unchanged wiki
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=cached_content, media_type="application/json", headers=headers)
     else:
         # Return 200 with null body if not found, as frontend expects this behavior
         # Or, raise HTTPException(status_code=404, detail="Wiki cache not found") if preferred
-        logger.info(f"Wiki cache not found for {owner}/{repo} ({repo_type}), lang: {language}")
-        return None
+        logger.info("Wiki cache not found for %s/%s (%s), lang: %s", owner, repo, repo_type, language)
+        return Response(content=b"null", media_type="application/json")
 
 @app.post("/api/wiki_cache")
 async def store_wiki_cache(request_data: WikiCacheRequest):
@@ -494,7 +802,7 @@ async def store_wiki_cache(request_data: WikiCacheRequest):
     if not supported_langs.__contains__(request_data.language):
         request_data.language = configs["lang_config"]["default"]
 
-    logger.info(f"Attempting to save wiki cache for {request_data.repo.owner}/{request_data.repo.repo} ({request_data.repo.type}), lang: {request_data.language}")
+    logger.info("Attempting to save wiki cache for %s/%s (%s), lang: %s", request_data.repo.owner, request_data.repo.repo, request_data.repo.type, request_data.language)
     success = await save_wiki_cache(request_data)
     if success:
         return {"message": "Wiki cache saved successfully"}
@@ -522,33 +830,51 @@ async def delete_wiki_cache(
         if not authorization_code or WIKI_AUTH_CODE != authorization_code:
             raise HTTPException(status_code=401, detail="Authorization code is invalid")
 
-    logger.info(f"Attempting to delete wiki cache for {owner}/{repo} ({repo_type}), lang: {language}")
+    logger.info("Attempting to delete wiki cache for %s/%s (%s), lang: %s", owner, repo, repo_type, language)
     cache_path = get_wiki_cache_path(owner, repo, repo_type, language)
 
-    if os.path.exists(cache_path):
-        try:
-            os.remove(cache_path)
-            logger.info(f"Successfully deleted wiki cache: {cache_path}")
-            return {"message": f"Wiki cache for {owner}/{repo} ({language}) deleted successfully"}
-        except Exception as e:
-            logger.error(f"Error deleting wiki cache {cache_path}: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to delete wiki cache: {str(e)}")
-    else:
-        logger.warning(f"Wiki cache not found, cannot delete: {cache_path}")
+    try:
+        # Unlink off the event loop; a missing file is the 404 case, no separate existence check
+        await run_wiki_cache_io(os.remove, cache_path)
+    except FileNotFoundError:
+        logger.warning("Wiki cache not found, cannot delete: %s", cache_path)
         raise HTTPException(status_code=404, detail="Wiki cache not found")
+    except OSError as e:
+        logger.error("Error deleting wiki cache %s: %s", cache_path, e)
+        raise HTTPException(status_code=500, detail=f"Failed to delete wiki cache: {str(e)}")
+
+    invalidate_wiki_cache_memory(owner, repo, repo_type, language)
+    invalidate_processed_projects_cache()
+    logger.info("Successfully deleted wiki cache: %s", cache_path)
+    return {"message": f"Wiki cache for {owner}/{repo} ({language}) deleted successfully"}
+
+# /health is polled constantly by Docker/orchestrators, so its payload is rebuilt at most once per second
+HEALTH_RESPONSE_TTL_SECONDS = 1.0
+health_response_cache: tuple[float, bytes] = (float("-inf"), b"")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Docker and monitoring"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "service": "deepwiki-api"
-    }
-
-@app.get("/")
-async def root():
-    """Root endpoint to check if the API is running and list available endpoints dynamically."""
+    global health_response_cache
+    now = time.monotonic()
+    cached_at, content = health_response_cache
+    if now - cached_at >= HEALTH_RESPONSE_TTL_SECONDS:
+        content = orjson.dumps({
+            "status": "healthy",
+            "timestamp": datetime.now().isoformat(),
+            "service": "deepwiki-api"
+        })
+        health_response_cache = (now, content)
+    return Response(content=content, media_type="application/json")
+
+@lru_cache(maxsize=1)
+def build_root_payload() -> bytes:
+    """
+    Lists the app's endpoints grouped by first path segment, serialized once.
+
+    Built on first use rather than at import, when routes declared later in this
+    module (and the chat routes) are all registered.
+    """
     # Collect routes dynamically from the FastAPI app
     endpoints = {}
     for route in app.routes:
@@ -567,68 +893,127 @@ async def root():
     for group in endpoints:
         endpoints[group].sort()
 
-    return {
+    return orjson.dumps({
         "message": "Welcome to Streaming API",
         "version": "1.0.0",
         "endpoints": endpoints
-    }
+    })
+
+@app.get("/")
+async def root():
+    """Root endpoint to check if the API is running and list available endpoints dynamically."""
+    return Response(content=build_root_payload(), media_type="application/json")
 
 # --- Processed Projects Endpoint --- (New Endpoint)
-@app.get("/api/processed_projects", response_model=List[ProcessedProjectEntry])
-async def get_processed_projects():
+
+# Expecting deepwiki_cache_{repo_type}_{owner}_{repo}_{language}.json
+# Example: deepwiki_cache_github_AsyncFuncAI_deepwiki-open_en.json
+# The repo name can contain underscores, the language is always the last part
+WIKI_CACHE_FILENAME_PREFIX = "deepwiki_cache_"
+WIKI_CACHE_FILENAME_SUFFIX = ".json"
+WIKI_CACHE_FILENAME_RE = re.compile(r"^deepwiki_cache_([^_]+)_([^_]+)_(.+)_([^_]+)\.json$")
+
+def scan_processed_projects() -> List[Dict[str, Any]]:
     """
-    Lists all processed projects found in the wiki cache directory.
+    Parses and stats every wiki cache file in WIKI_CACHE_DIR.
+
+    Blocking; run it in a worker thread so the whole scan costs a single hop.
+    Entries are plain dicts in the ProcessedProjectEntry shape: every field is
+    derived locally, so there is nothing to validate.
+    """
+    project_entries: List[Dict[str, Any]] = []
+    prefix, prefix_len = WIKI_CACHE_FILENAME_PREFIX, len(WIKI_CACHE_FILENAME_PREFIX)
+    suffix, suffix_len = WIKI_CACHE_FILENAME_SUFFIX, len(WIKI_CACHE_FILENAME_SUFFIX)
+
+    with os.scandir(WIKI_CACHE_DIR) as entries:
+        for entry in entries:
+            filename = entry.name
+            # Cheap slice comparisons drop temp files and other artifacts before the regex runs
+            if filename[:prefix_len] != prefix or filename[-suffix_len:] != suffix:
+                continue
+            match = WIKI_CACHE_FILENAME_RE.match(filename)
+            if not match:
+                logger.warning("Could not parse project details from filename: %s", filename)
+                continue
+
+            try:
+                # DirEntry reuses the path built by scandir (and the stat it read, where the OS provides one)
+                stats = entry.stat()
+            except OSError as e:
+                logger.error("Error processing file %s: %s", entry.path, e)
+                continue # Skip this file on error
+
+            repo_type, owner, repo, language = match.groups()
+            project_entries.append({
+                "id": filename,
+                "owner": owner,
+                "repo": repo,
+                "name": f"{owner}/{repo}",
+                "repo_type": repo_type,
+                "submittedAt": int(stats.st_mtime * 1000), # Convert to milliseconds
+                "language": language
+            })
+
+    return project_entries
+
+def projects_page_response(
+    project_entries: List[Dict[str, Any]],
+    encoded_entries: bytes,
+    limit: Optional[int],
+    offset: int,
+    headers: Dict[str, str]
+) -> Response:
+    """Returns one page of an already sorted project listing."""
+    if limit is None and not offset:
+        # The whole listing: reuse its encoded form instead of serializing it again
+        return Response(content=encoded_entries, media_type="application/json", headers=headers)
+    end = None if limit is None else offset + limit
+    return ORJSONResponse(project_entries[offset:end], headers=headers)
+
+@app.get("/api/processed_projects", response_model=None, responses={200: {"model": List[ProcessedProjectEntry]}})
+async def get_processed_projects(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of projects to return (default: all)"),
+    offset: int = Query(0, ge=0, description="Number of most recent projects to skip")
+):
+    """
+    Lists all processed projects found in the wiki cache directory, most recent first.
     Projects are identified by files named like: deepwiki_cache_{repo_type}_{owner}_{repo}_{language}.json
     """
-    project_entries: List[ProcessedProjectEntry] = []
     # WIKI_CACHE_DIR is already defined globally in the file
 
+    global processed_projects_cache
+
     try:
-        if not os.path.exists(WIKI_CACHE_DIR):
-            logger.info(f"Cache directory {WIKI_CACHE_DIR} not found. Returning empty list.")
+        try:
+            dir_mtime_ns = (await run_wiki_cache_io(os.stat, WIKI_CACHE_DIR)).st_mtime_ns
+        except FileNotFoundError:
+            logger.info("Cache directory %s not found. Returning empty list.", WIKI_CACHE_DIR)
             return []
 
-        logger.info(f"Scanning for project cache files in: {WIKI_CACHE_DIR}")
-        filenames = await asyncio.to_thread(os.listdir, WIKI_CACHE_DIR) # Use asyncio.to_thread for os.listdir
-
-        for filename in filenames:
-            if filename.startswith("deepwiki_cache_") and filename.endswith(".json"):
-                file_path = os.path.join(WIKI_CACHE_DIR, filename)
-                try:
-                    stats = await asyncio.to_thread(os.stat, file_path) # Use asyncio.to_thread for os.stat
-                    parts = filename.replace("deepwiki_cache_", "").replace(".json", "").split('_')
-
-                    # Expecting repo_type_owner_repo_language
-                    # Example: deepwiki_cache_github_AsyncFuncAI_deepwiki-open_en.json
-                    # parts = [github, AsyncFuncAI, deepwiki-open, en]
-                    if len(parts) >= 4:
-                        repo_type = parts[0]
-                        owner = parts[1]
-                        language = parts[-1] # language is the last part
-                        repo = "_".join(parts[2:-1]) # repo can contain underscores
-
-                        project_entries.append(
-                            ProcessedProjectEntry(
-                                id=filename,
-                                owner=owner,
-                                repo=repo,
-                                name=f"{owner}/{repo}",
-                                repo_type=repo_type,
-                                submittedAt=int(stats.st_mtime * 1000), # Convert to milliseconds
-                                language=language
-                            )
-                        )
-                    else:
-                        logger.warning(f"Could not parse project details from filename: {filename}")
-                except Exception as e:
-                    logger.error(f"Error processing file {file_path}: {e}")
-                    continue # Skip this file on error
+        # The listing only changes with the directory mtime, so polling clients that
+        # already have it get a 304 for the cost of that one stat
+        etag = f'W/"{dir_mtime_ns:x}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+
+        # Unchanged directory: a single stat instead of a full rescan
+        cached = processed_projects_cache
+        if cached is not None and cached[0] == dir_mtime_ns:
+            return projects_page_response(cached[1], cached[2], limit, offset, headers)
+
+        logger.info("Scanning for project cache files in: %s", WIKI_CACHE_DIR)
+        project_entries = await run_wiki_cache_io(scan_processed_projects)
 
         # Sort by most recent first
-        project_entries.sort(key=lambda p: p.submittedAt, reverse=True)
-        logger.info(f"Found {len(project_entries)} processed project entries.")
-        return project_entries
+        project_entries.sort(key=lambda p: p["submittedAt"], reverse=True)
+        logger.info("Found %s processed project entries.", len(project_entries))
+        # Keyed by the mtime read before scanning, so changes made mid-scan force a rescan
+        encoded_entries = orjson.dumps(project_entries)
+        processed_projects_cache = (dir_mtime_ns, project_entries, encoded_entries)
+        return projects_page_response(project_entries, encoded_entries, limit, offset, headers)
 
     except Exception as e:
-        logger.error(f"Error listing processed projects from {WIKI_CACHE_DIR}: {e}", exc_info=True)
+        logger.error("Error listing processed projects from %s: %s", WIKI_CACHE_DIR, e, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to list processed projects from server cache.")
@@ -8,6 +8,7 @@ import tiktoken
 import logging
 import base64
 import glob
+from functools import lru_cache
 from adalflow.utils import get_adalflow_default_root_path
 from adalflow.core.db import LocalDB
 from api.config import configs, DEFAULT_EXCLUDED_DIRS, DEFAULT_EXCLUDED_FILES
@@ -24,6 +25,33 @@ logger = logging.getLogger(__name__)
 # Maximum token limit for OpenAI embedding models
 MAX_EMBEDDING_TOKENS = 8192
 
+@lru_cache(maxsize=None)
+def get_token_encoding(embedder_type: str = None) -> tiktoken.Encoding:
+    """
+    Get the tiktoken encoding used to count tokens for an embedder type.
+
+    Cached, since count_tokens runs for every file while indexing a repository.
+
+    Args:
+        embedder_type (str, optional): The embedder type ('openai', 'google', 'ollama', 'bedrock').
+
+    Returns:
+        tiktoken.Encoding: The encoding for the embedder type.
+    """
+    # Choose encoding based on embedder type
+    if embedder_type == 'ollama':
+        # Ollama typically uses cl100k_base encoding
+        return tiktoken.get_encoding("cl100k_base")
+    elif embedder_type == 'google':
+        # Google uses similar tokenization to GPT models for rough estimation
+        return tiktoken.get_encoding("cl100k_base")
+    elif embedder_type == 'bedrock':
+        # Bedrock embedding models vary; use a common GPT-like encoding for rough estimation
+        return tiktoken.get_encoding("cl100k_base")
+    else:  # OpenAI or default
+        # Use OpenAI embedding model encoding
+        return tiktoken.encoding_for_model("text-embedding-3-small")
+
 def count_tokens(text: str, embedder_type: str = None, is_ollama_embedder: bool = None) -> int:
     """
     Count the number of tokens in a text string using tiktoken.
@@ -48,20 +76,7 @@ def count_tokens(text: str, embedder_type: str = None, is_ollama_embedder: bool
             from api.config import get_embedder_type
             embedder_type = get_embedder_type()
 
-        # Choose encoding based on embedder type
-        if embedder_type == 'ollama':
-            # Ollama typically uses cl100k_base encoding
-            encoding = tiktoken.get_encoding("cl100k_base")
-        elif embedder_type == 'google':
-            # Google uses similar tokenization to GPT models for rough estimation
-            encoding = tiktoken.get_encoding("cl100k_base")
-        elif embedder_type == 'bedrock':
-            # Bedrock embedding models vary; use a common GPT-like encoding for rough estimation
-            encoding = tiktoken.get_encoding("cl100k_base")
-        else:  # OpenAI or default
-            # Use OpenAI embedding model encoding
-            encoding = tiktoken.encoding_for_model("text-embedding-3-small")
-
+        encoding = get_token_encoding(embedder_type)
         return len(encoding.encode(text))
     except Exception as e:
         # Fallback to a simple approximation if tiktoken fails
@@ -69,6 +84,48 @@ def count_tokens(text: str, embedder_type: str = None, is_ollama_embedder: bool
         # Rough approximation: 4 characters per token
         return len(text) // 4
 
+# Number of texts encoded per tiktoken batch; bounds the token id lists held at once
+TOKEN_COUNT_BATCH_SIZE = 64
+
+def count_tokens_batch(texts: List[str], embedder_type: str = None) -> List[int]:
+    """
+    Count the number of tokens in several text strings using tiktoken.
+
+    The texts are encoded in batches on tiktoken's worker threads, which is much
+    faster than calling count_tokens on each of them when indexing a repository.
+
+    Args:
+        texts (List[str]): The texts to count tokens for.
+        embedder_type (str, optional): The embedder type ('openai', 'google', 'ollama', 'bedrock').
+                                     If None, will be determined from configuration.
+
+    Returns:
+        List[int]: The number of tokens in each text, in order.
+    """
+    if not texts:
+        return []
+
+    try:
+        if embedder_type is None:
+            from api.config import get_embedder_type
+            embedder_type = get_embedder_type()
+        encoding = get_token_encoding(embedder_type)
+    except Exception as e:
+        logger.warning(f"Error loading tiktoken encoding: {e}")
+        return [count_tokens(text, embedder_type) for text in texts]
+
+    token_counts = []
+    for start in range(0, len(texts), TOKEN_COUNT_BATCH_SIZE):
+        batch = texts[start:start + TOKEN_COUNT_BATCH_SIZE]
+        try:
+            token_counts.extend(len(tokens) for tokens in encoding.encode_batch(batch))
+        except Exception as e:
+            # One bad text fails its whole batch, so count that batch one by one
+            # and let count_tokens apply its fallback to the offending text only
+            logger.warning(f"Error batch counting tokens with tiktoken: {e}")
+            token_counts.extend(count_tokens(text, embedder_type) for text in batch)
+    return token_counts
+
 def download_repo(repo_url: str, local_path: str, repo_type: str = None, access_token: str = None) -> str:
     """
     Downloads a Git repository (GitHub, GitLab, or Bitbucket) to a specified local path.
@@ -309,8 +366,9 @@ def read_all_documents(path: str, embedder_type: str = None, is_ollama_embedder:
 
             return not is_excluded
 
-    # Process code files first
-    for ext in code_extensions:
+    def read_files(ext: str) -> List[tuple]:
+        """Read every file with the given extension that passes the inclusion/exclusion rules."""
+        file_contents = []
         files = glob.glob(f"{path}/**/*{ext}", recursive=True)
         for file_path in files:
             # Check if file should be processed based on inclusion/exclusion rules
@@ -319,70 +377,69 @@ def read_all_documents(path: str, embedder_type: str = None, is_ollama_embedder:
 
             try:
                 with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    relative_path = os.path.relpath(file_path, path)
-
-                    # Determine if this is an implementation file
-                    is_implementation = (
-                        not relative_path.startswith("test_")
-                        and not relative_path.startswith("app_")
-                        and "test" not in relative_path.lower()
-                    )
-
-                    # Check token count
-                    token_count = count_tokens(content, embedder_type)
-                    if token_count > MAX_EMBEDDING_TOKENS * 10:
-                        logger.warning(f"Skipping large file {relative_path}: Token count ({token_count}) exceeds limit")
-                        continue
-
-                    doc = Document(
-                        text=content,
-                        meta_data={
-                            "file_path": relative_path,
-                            "type": ext[1:],
-                            "is_code": True,
-                            "is_implementation": is_implementation,
-                            "title": relative_path,
-                            "token_count": token_count,
-                        },
-                    )
-                    documents.append(doc)
+                    file_contents.append((file_path, f.read()))
             except Exception as e:
                 logger.error(f"Error reading {file_path}: {e}")
+        return file_contents
+
+    # Process code files first
+    for ext in code_extensions:
+        file_contents = read_files(ext)
+        # Count tokens for all files of this type together
+        token_counts = count_tokens_batch([content for _, content in file_contents], embedder_type)
+        for (file_path, content), token_count in zip(file_contents, token_counts):
+            relative_path = os.path.relpath(file_path, path)
+
+            # Determine if this is an implementation file
+            is_implementation = (
+                not relative_path.startswith("test_")
+                and not relative_path.startswith("app_")
+                and "test" not in relative_path.lower()
+            )
+
+            # Check token count
+            if token_count > MAX_EMBEDDING_TOKENS * 10:
+                logger.warning(f"Skipping large file {relative_path}: Token count ({token_count}) exceeds limit")
+                continue
+
+            doc = Document(
+                text=content,
+                meta_data={
+                    "file_path": relative_path,
+                    "type": ext[1:],
+                    "is_code": True,
+                    "is_implementation": is_implementation,
+                    "title": relative_path,
+                    "token_count": token_count,
+                },
+            )
+            documents.append(doc)
 
     # Then process documentation files
     for ext in doc_extensions:
-        files = glob.glob(f"{path}/**/*{ext}", recursive=True)
-        for file_path in files:
-            # Check if file should be processed based on inclusion/exclusion rules
-            if not should_process_file(file_path, use_inclusion_mode, included_dirs, included_files, excluded_dirs, excluded_files):
+        file_contents = read_files(ext)
+        # Count tokens for all files of this type together
+        token_counts = count_tokens_batch([content for _, content in file_contents], embedder_type)
+        for (file_path, content), token_count in zip(file_contents, token_counts):
+            relative_path = os.path.relpath(file_path, path)
+
+            # Check token count
+            if token_count > MAX_EMBEDDING_TOKENS:
+                logger.warning(f"Skipping large file {relative_path}: Token count ({token_count}) exceeds limit")
                 continue
 
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    relative_path = os.path.relpath(file_path, path)
-
-                    # Check token count
-                    token_count = count_tokens(content, embedder_type)
-                    if token_count > MAX_EMBEDDING_TOKENS:
-                        logger.warning(f"Skipping large file {relative_path}: Token count ({token_count}) exceeds limit")
-                        continue
-
-                    doc = Document(
-                        text=content,
-                        meta_data={
-                            "file_path": relative_path,
-                            "type": ext[1:],
-                            "is_code": False,
-                            "is_implementation": False,
-                            "title": relative_path,
-                            "token_count": token_count,
-                        },
-                    )
-                    documents.append(doc)
-            except Exception as e:
-                logger.error(f"Error reading {file_path}: {e}")
+            doc = Document(
+                text=content,
+                meta_data={
+                    "file_path": relative_path,
+                    "type": ext[1:],
+                    "is_code": False,
+                    "is_implementation": False,
+                    "title": relative_path,
+                    "token_count": token_count,
+                },
+            )
+            documents.append(doc)
 
     logger.info(f"Found {len(documents)} documents")
     return documents
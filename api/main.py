@@ -63,16 +63,22 @@ if __name__ == "__main__":
     # Get port from environment variable or use default
     port = int(os.environ.get("PORT", 8001))
 
+    # Each worker is a separate process with its own event loop, so CPU-heavy requests
+    # (large wiki cache or export payloads) only stall the worker serving them.
+    # Something like (2 x CPU cores) + 1 suits production; reload mode always runs one.
+    workers = int(os.environ.get("API_WORKERS", 1))
+
     # Import the app here to ensure environment variables are set first
     from api.api import app
 
-    logger.info(f"Starting Streaming API on port {port}")
+    logger.info(f"Starting Streaming API on port {port} (workers: {workers})")
 
     # Run the FastAPI app with uvicorn
     uvicorn.run(
         "api.api:app",
         host="0.0.0.0",
         port=port,
+        workers=None if is_development else workers,
         reload=is_development,
         reload_excludes=["**/logs/*", "**/__pycache__/*", "**/*.pyc"] if is_development else None,
     )
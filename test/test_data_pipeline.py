@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for token counting in the data pipeline
+
+Run this script to test batch token counting and the size limits applied while reading a repository.
+Usage: python -m pytest test/test_data_pipeline.py
+"""
+
+import pytest
+import os
+import sys
+from unittest.mock import patch
+
+# Add the parent directory to the path to import the data_pipeline module
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import the modules under test
+from api.data_pipeline import (
+    MAX_EMBEDDING_TOKENS,
+    TOKEN_COUNT_BATCH_SIZE,
+    count_tokens_batch,
+    read_all_documents,
+)
+
+
+class FakeEncoding:
+    """Counts one token per word and, like tiktoken, rejects special tokens in the text"""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def encode(self, text):
+        if "<|endoftext|>" in text:
+            raise ValueError("Encountered text corresponding to disallowed special token '<|endoftext|>'")
+        return text.split()
+
+    def encode_batch(self, texts):
+        self.batch_sizes.append(len(texts))
+        return [self.encode(text) for text in texts]
+
+
+class TestCountTokensBatch:
+    """Tests for count_tokens_batch"""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.encoding = FakeEncoding()
+        self.patcher = patch("api.data_pipeline.get_token_encoding", return_value=self.encoding)
+        self.patcher.start()
+
+    def teardown_method(self):
+        self.patcher.stop()
+
+    def test_empty_input(self):
+        assert count_tokens_batch([], "openai") == []
+        assert self.encoding.batch_sizes == []
+
+    def test_counts_in_order(self):
+        result = count_tokens_batch(["one", "two words", "and three words"], "openai")
+        assert result == [1, 2, 3]
+
+    def test_splits_into_batches(self):
+        texts = ["word " * i for i in range(TOKEN_COUNT_BATCH_SIZE * 2 + 1)]
+        result = count_tokens_batch(texts, "openai")
+        assert result == list(range(TOKEN_COUNT_BATCH_SIZE * 2 + 1))
+        assert self.encoding.batch_sizes == [TOKEN_COUNT_BATCH_SIZE, TOKEN_COUNT_BATCH_SIZE, 1]
+
+    def test_failed_batch_falls_back_per_text(self):
+        bad_text = "some text <|endoftext|> more"
+        texts = ["a b"] * TOKEN_COUNT_BATCH_SIZE + ["c d e", bad_text, "f"]
+        result = count_tokens_batch(texts, "openai")
+
+        # The first batch is unaffected by the bad text in the second one
+        assert result[:TOKEN_COUNT_BATCH_SIZE] == [2] * TOKEN_COUNT_BATCH_SIZE
+        # In the failed batch only the bad text falls back to the character estimate
+        assert result[TOKEN_COUNT_BATCH_SIZE:] == [3, len(bad_text) // 4, 1]
+
+    def test_encoding_load_failure_falls_back_per_text(self):
+        with patch("api.data_pipeline.get_token_encoding", side_effect=KeyError("unknown encoding")):
+            result = count_tokens_batch(["abcdefgh", "abcd"], "openai")
+        assert result == [2, 1]
+
+
+class TestReadAllDocumentsTokenLimits:
+    """Tests for the token limits applied by read_all_documents"""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.patcher = patch("api.data_pipeline.get_token_encoding", return_value=FakeEncoding())
+        self.patcher.start()
+
+    def teardown_method(self):
+        self.patcher.stop()
+
+    def read_repo(self, tmp_path, monkeypatch, files):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        for name, token_count in files.items():
+            (repo / name).write_text("word " * token_count, encoding="utf-8")
+        # Read through a relative path, since the default exclusions skip any "tmp" directory
+        monkeypatch.chdir(tmp_path)
+        documents = read_all_documents("repo", embedder_type="openai")
+        return {doc.meta_data["file_path"]: doc.meta_data["token_count"] for doc in documents}
+
+    def test_code_file_limit(self, tmp_path, monkeypatch):
+        result = self.read_repo(tmp_path, monkeypatch, {
+            "at_limit.py": MAX_EMBEDDING_TOKENS * 10,
+            "over_limit.py": MAX_EMBEDDING_TOKENS * 10 + 1,
+        })
+        assert result == {"at_limit.py": MAX_EMBEDDING_TOKENS * 10}
+
+    def test_doc_file_limit(self, tmp_path, monkeypatch):
+        result = self.read_repo(tmp_path, monkeypatch, {
+            "at_limit.md": MAX_EMBEDDING_TOKENS,
+            "over_limit.md": MAX_EMBEDDING_TOKENS + 1,
+        })
+        assert result == {"at_limit.md": MAX_EMBEDDING_TOKENS}
+
+    def test_code_files_get_the_larger_limit(self, tmp_path, monkeypatch):
+        result = self.read_repo(tmp_path, monkeypatch, {
+            "module.py": MAX_EMBEDDING_TOKENS + 1,
+            "notes.txt": MAX_EMBEDDING_TOKENS + 1,
+        })
+        assert result == {"module.py": MAX_EMBEDDING_TOKENS + 1}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the wiki cache file helpers in api.api
+
+Usage: python -m pytest test/test_wiki_cache.py
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add the parent directory to the path to import the api module
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import the modules under test
+import api.api as api_module
+from api.api import invalidate_wiki_cache_memory, remember_wiki_cache, write_file_atomic
+
+
+class TestWriteFileAtomic:
+    """Tests for write_file_atomic"""
+
+    def test_writes_new_file(self, tmp_path):
+        target = tmp_path / "deepwiki_cache_github_owner_repo_en.json"
+
+        write_file_atomic(str(target), b'{"a": 1}')
+
+        assert target.read_bytes() == b'{"a": 1}'
+        assert os.listdir(tmp_path) == [target.name]
+
+    def test_replaces_existing_file(self, tmp_path):
+        target = tmp_path / "cache.json"
+        target.write_bytes(b"old content that is longer")
+
+        write_file_atomic(str(target), b"new")
+
+        assert target.read_bytes() == b"new"
+
+    def test_failed_replace_keeps_original_and_removes_temp_file(self, tmp_path):
+        target = tmp_path / "cache.json"
+        target.write_bytes(b"original")
+
+        with patch("api.api.os.replace", side_effect=OSError("boom")):
+            with pytest.raises(OSError):
+                write_file_atomic(str(target), b"new")
+
+        assert target.read_bytes() == b"original"
+        assert os.listdir(tmp_path) == [target.name]
+
+
+class TestWikiCacheMemory:
+    """Tests for the byte-bounded in-memory wiki cache"""
+
+    def setup_method(self):
+        """Start every test from an empty in-memory cache."""
+        api_module.wiki_cache_memory.clear()
+        api_module.wiki_cache_memory_bytes = 0
+
+    teardown_method = setup_method
+
+    def test_evicts_least_recently_used_over_budget(self):
+        with patch("api.api.WIKI_CACHE_MEMORY_MAX_BYTES", 10):
+            remember_wiki_cache(("a",), ("etag-a", b"aaaa"))
+            remember_wiki_cache(("b",), ("etag-b", b"bbbb"))
+            remember_wiki_cache(("c",), ("etag-c", b"cccc"))
+
+        assert list(api_module.wiki_cache_memory) == [("b",), ("c",)]
+        assert api_module.wiki_cache_memory_bytes == 8
+
+    def test_replacing_an_entry_accounts_for_its_old_size(self):
+        remember_wiki_cache(("a",), ("etag-1", b"a" * 100))
+        remember_wiki_cache(("a",), ("etag-2", b"a" * 10))
+
+        assert api_module.wiki_cache_memory[("a",)] == ("etag-2", b"a" * 10)
+        assert api_module.wiki_cache_memory_bytes == 10
+
+    def test_entry_larger_than_budget_is_not_kept(self):
+        with patch("api.api.WIKI_CACHE_MEMORY_MAX_BYTES", 10):
+            remember_wiki_cache(("a",), ("etag-a", b"aaaa"))
+            remember_wiki_cache(("big",), ("etag-big", b"x" * 11))
+
+        assert list(api_module.wiki_cache_memory) == [("a",)]
+        assert api_module.wiki_cache_memory_bytes == 4
+
+    def test_invalidate_releases_bytes(self):
+        remember_wiki_cache(("o", "r", "github", "en"), ("etag", b"12345"))
+
+        invalidate_wiki_cache_memory("o", "r", "github", "en")
+
+        assert not api_module.wiki_cache_memory
+        assert api_module.wiki_cache_memory_bytes == 0
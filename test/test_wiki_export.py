@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the wiki export helpers in api.api
+
+Usage: python -m pytest test/test_wiki_export.py
+"""
+
+import json
+import os
+import sys
+
+import cbor2
+
+# Add the parent directory to the path to import the api module
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Import the modules under test
+from api.api import (
+    WikiPage,
+    generate_cbor_export,
+    generate_json_export,
+    generate_markdown_export,
+    iter_json_export,
+    iter_markdown_export,
+)
+
+
+def make_page(page_id, title, related=None, content="content"):
+    return WikiPage(
+        id=page_id,
+        title=title,
+        content=content,
+        filePaths=[],
+        importance="high",
+        relatedPages=related or [],
+    )
+
+
+class TestGenerateMarkdownExport:
+    """Tests for generate_markdown_export"""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.pages = [
+            make_page("intro", "Introduction", related=["setup", "missing"], content="Intro body"),
+            make_page("setup", "Setup", related=["intro"], content="Setup body"),
+        ]
+
+    def test_table_of_contents_lists_every_page(self):
+        markdown = generate_markdown_export("https://github.com/owner/repo", self.pages)
+
+        assert markdown.startswith("# Wiki Documentation for https://github.com/owner/repo\n\n")
+        assert "## Table of Contents\n\n- [Introduction](#intro)\n- [Setup](#setup)\n\n" in markdown
+
+    def test_related_pages_resolve_titles_and_skip_unknown_ids(self):
+        markdown = generate_markdown_export("https://github.com/owner/repo", self.pages)
+
+        assert "Related topics: [Setup](#setup)\n\n" in markdown
+        assert "Related topics: [Introduction](#intro)\n\n" in markdown
+        assert "#missing" not in markdown
+
+    def test_pages_are_rendered_in_order(self):
+        markdown = generate_markdown_export("https://github.com/owner/repo", self.pages)
+
+        intro = markdown.index("<a id='intro'></a>\n\n## Introduction\n\n")
+        setup = markdown.index("<a id='setup'></a>\n\n## Setup\n\n")
+        assert intro < setup
+        assert markdown.endswith("Setup body\n\n---\n\n")
+
+    def test_page_without_related_pages_has_no_related_section(self):
+        markdown = generate_markdown_export("https://github.com/owner/repo", [make_page("solo", "Solo")])
+
+        assert "### Related Pages" not in markdown
+
+    def test_iter_yields_header_then_one_chunk_per_page(self):
+        chunks = list(iter_markdown_export("https://github.com/owner/repo", self.pages))
+
+        assert len(chunks) == 3
+        assert chunks[0].endswith("- [Setup](#setup)\n\n")
+        assert chunks[2].startswith("<a id='setup'></a>")
+
+
+class TestGenerateJsonExport:
+    """Tests for generate_json_export"""
+
+    def test_export_contains_metadata_and_pages(self):
+        pages = [
+            make_page("intro", "Introduction", related=["setup"], content='Line one\n"quoted" ü'),
+            make_page("setup", "Setup"),
+        ]
+
+        data = json.loads(generate_json_export("https://github.com/owner/repo", pages))
+
+        assert data["metadata"]["repository"] == "https://github.com/owner/repo"
+        assert data["metadata"]["page_count"] == 2
+        assert data["pages"] == [page.model_dump() for page in pages]
+
+    def test_export_is_pretty_printed(self):
+        content = generate_json_export("https://github.com/owner/repo", [make_page("intro", "Introduction")])
+
+        assert isinstance(content, bytes)
+        assert content.startswith(b'{\n  "metadata": {\n    "repository": ')
+        assert b'\n  "pages": [\n    {\n      "id": "intro",' in content
+
+    def test_iter_chunks_join_to_valid_json(self):
+        pages = [make_page("intro", "Introduction"), make_page("setup", "Setup")]
+
+        chunks = list(iter_json_export("https://github.com/owner/repo", pages))
+
+        assert len(chunks) == 4
+        assert [page["id"] for page in json.loads(b"".join(chunks))["pages"]] == ["intro", "setup"]
+
+    def test_export_without_pages(self):
+        data = json.loads(generate_json_export("https://github.com/owner/repo", []))
+
+        assert data["metadata"]["page_count"] == 0
+        assert data["pages"] == []
+
+
+class TestGenerateCborExport:
+    """Tests for generate_cbor_export"""
+
+    def test_export_round_trips_metadata_and_pages(self):
+        pages = [make_page("intro", "Introduction", related=["setup"]), make_page("setup", "Setup")]
+
+        data = cbor2.loads(generate_cbor_export("https://github.com/owner/repo", pages))
+
+        assert data["metadata"]["repository"] == "https://github.com/owner/repo"
+        assert data["metadata"]["page_count"] == 2
+        assert data["pages"] == [page.model_dump() for page in pages]